@@ -17,6 +17,7 @@
 import inspect
 from copy import deepcopy
 from typing import Union, Any, get_type_hints
+from weakref import WeakKeyDictionary
 
 from .address import Address, MalformedAddress, is_icon_address_valid
 from .exception import InvalidParamsException
@@ -27,6 +28,9 @@ from ..utils import get_main_type_from_annotations_type
 
 score_base_support_type = (int, str, bytes, bool, Address)
 
+# Annotations used by adjust_params_to_method() keyed by the function (not a bound method)
+_method_annotations_cache = WeakKeyDictionary()
+
 
 class TypeConverter:
     @staticmethod
@@ -262,9 +266,26 @@ class TypeConverter:
             kw_param = TypeConverter._convert_data_value(param_type, kw_param)
             kw_params[param_name] = kw_param
 
+    @staticmethod
+    def _get_method_annotations(func: callable) -> dict:
+        """Returns the cached annotations of func which must not be modified
+        """
+        key = getattr(func, '__func__', func)
+
+        hints = _method_annotations_cache.get(key)
+        if hints is None:
+            hints = TypeConverter.make_annotations_from_method(func)
+            try:
+                _method_annotations_cache[key] = hints
+            except TypeError:
+                # func cannot be weakly referenced
+                pass
+
+        return hints
+
     @staticmethod
     def adjust_params_to_method(func: callable, kw_params: dict):
-        hints = TypeConverter.make_annotations_from_method(func)
+        hints = TypeConverter._get_method_annotations(func)
 
         # check user input argument name is valid
         for key in kw_params.keys():
@@ -97,8 +97,12 @@ class KeyValueDatabase(object):
         """
         return KeyValueDatabase(self._db.prefixed_db(prefix))
 
-    def iterator(self) -> iter:
-        return self._db.iterator()
+    def iterator(self, prefix: Optional[bytes] = None) -> iter:
+        """Return an iterator over the key-value pairs
+
+        :param prefix: iterate only the keys starting with prefix
+        """
+        return self._db.iterator(prefix=prefix)
 
     def write_batch(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
         """Write a batch to the database for the specified states dict.
@@ -15,7 +15,7 @@
 # limitations under the License.
 
 
-import threading
+from contextvars import ContextVar
 from typing import Optional, List, TYPE_CHECKING
 
 from ...base.exception import FatalException
@@ -23,7 +23,8 @@ from ...base.exception import FatalException
 if TYPE_CHECKING:
     from ..icon_score_context import IconScoreContext
 
-_thread_local_data = threading.local()
+# Every thread (and asyncio task) has its own value of a ContextVar
+_context_stack: ContextVar[Optional[List['IconScoreContext']]] = ContextVar('context_stack', default=None)
 
 
 class ContextContainer(object):
@@ -35,41 +36,35 @@ class ContextContainer(object):
 
     @staticmethod
     def _get_context() -> Optional['IconScoreContext']:
-        context_stack: List['IconScoreContext'] = getattr(_thread_local_data, 'context_stack', None)
-
-        if context_stack is not None and len(context_stack) > 0:
-            return context_stack[-1]
-        else:
-            return None
+        context_stack: List['IconScoreContext'] = _context_stack.get()
+        return context_stack[-1] if context_stack else None
 
     @staticmethod
     def _push_context(context: 'IconScoreContext') -> None:
-        context_stack: List['IconScoreContext'] = getattr(_thread_local_data, 'context_stack', None)
-
+        context_stack: List['IconScoreContext'] = _context_stack.get()
         if context_stack is None:
             context_stack = []
-            setattr(_thread_local_data, 'context_stack', context_stack)
-
+            _context_stack.set(context_stack)
         context_stack.append(context)
 
     @staticmethod
     def _pop_context() -> 'IconScoreContext':
         """Delete the last pushed context of the current thread
         """
-        context_stack: List['IconScoreContext'] = getattr(_thread_local_data, 'context_stack', None)
+        context_stack: List['IconScoreContext'] = _context_stack.get()
 
-        if context_stack is not None and len(context_stack) > 0:
+        if context_stack:
             return context_stack.pop()
         else:
             raise FatalException('Failed to pop a context out of context_stack')
 
     @staticmethod
     def _clear_context() -> None:
-        setattr(_thread_local_data, 'context_stack', None)
+        _context_stack.set(None)
 
     @staticmethod
     def _get_context_stack_size() -> int:
-        context_stack: List['IconScoreContext'] = getattr(_thread_local_data, 'context_stack', None)
+        context_stack: List['IconScoreContext'] = _context_stack.get()
         return 0 if context_stack is None else len(context_stack)
 
 
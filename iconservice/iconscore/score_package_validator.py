@@ -22,7 +22,7 @@ from ..base.exception import IllegalFormatException
 CODE_ATTR = 'co_code'
 CODE_NAMES_ATTR = 'co_names'
 
-BLACKLIST_RESERVED_KEYWORD = ['exec', 'eval', 'compile', '__import__']
+BLACKLIST_RESERVED_KEYWORD = frozenset(('exec', 'eval', 'compile', '__import__'))
 
 LOAD_CONST = 100
 IMPORT_STAR = 84
@@ -40,9 +40,10 @@ OPCODE_HEADER_END_INDEX = 4
 
 
 class ScorePackageValidator(object):
-    WHITELIST_IMPORT = {}
+    # Import whitelist with frozenset values for O(1) lookups
+    WHITELIST_IMPORT_SETS = {}
     CUSTOM_IMPORT_LIST = []
-    ICONSERVICE_WHITELIST = []
+    ICONSERVICE_WHITELIST = frozenset()
 
     @classmethod
     def _init_iconservice_whitelist(cls):
@@ -60,6 +61,7 @@ class ScorePackageValidator(object):
             return
 
         byte_code_list = [x for x in code.co_code]
+        whitelist = []
 
         length_byte_code_list = len(byte_code_list)
         for code_index in range(OPCODE_HEADER_END_INDEX, length_byte_code_list, 2):
@@ -74,7 +76,9 @@ class ScorePackageValidator(object):
                     continue
 
                 from_list = code.co_consts[from_list_index]
-                cls.ICONSERVICE_WHITELIST.extend(from_list)
+                whitelist.extend(from_list)
+
+        cls.ICONSERVICE_WHITELIST = frozenset(whitelist)
         return cls.ICONSERVICE_WHITELIST
 
     @classmethod
@@ -83,7 +87,8 @@ class ScorePackageValidator(object):
                 pkg_root_path: str,
                 pkg_root_package: str) -> callable:
 
-        cls.WHITELIST_IMPORT = whitelist_table
+        cls.WHITELIST_IMPORT_SETS = \
+            {import_name: frozenset(from_list) for import_name, from_list in whitelist_table.items()}
         cls.CUSTOM_IMPORT_LIST = cls._make_custom_import_list(pkg_root_path)
         cls._init_iconservice_whitelist()
 
@@ -132,7 +137,8 @@ class ScorePackageValidator(object):
         if not hasattr(code, CODE_ATTR):
             return
 
-        byte_code_list = [x for x in code.co_code]
+        # Indexing bytes returns int, so co_code doesn't need to be copied into a list
+        byte_code_list: bytes = code.co_code
 
         length_byte_code_list = len(byte_code_list)
         for code_index in range(OPCODE_HEADER_END_INDEX, length_byte_code_list, 2):
@@ -154,7 +160,7 @@ class ScorePackageValidator(object):
     @classmethod
     def _validate_import(cls,
                          current_index: int,
-                         byte_code_list: list,
+                         byte_code_list: bytes,
                          co_names: tuple,
                          co_consts: tuple):
         """ example
@@ -194,7 +200,7 @@ class ScorePackageValidator(object):
         if level > 0:
             return
 
-        if import_name not in cls.WHITELIST_IMPORT:
+        if import_name not in cls.WHITELIST_IMPORT_SETS:
             raise IllegalFormatException(f'Invalid import name: {import_name}')
 
         if from_list is None:
@@ -208,9 +214,9 @@ class ScorePackageValidator(object):
                     raise IllegalFormatException(f'Invalid star import: {import_name}')
             elif IMPORT_FROM == next_op_code_key:
                 # import from
+                allowed_from_set: frozenset = cls.WHITELIST_IMPORT_SETS[import_name]
                 for import_from in from_list:
-                    if '*' not in cls.WHITELIST_IMPORT[import_name] and \
-                            import_from not in cls.WHITELIST_IMPORT[import_name]:
+                    if '*' not in allowed_from_set and import_from not in allowed_from_set:
                         raise IllegalFormatException(f'Invalid import name: {import_name}')
                     elif import_name in BASE_PACKAGE and \
                             import_from not in cls.ICONSERVICE_WHITELIST:
@@ -46,6 +46,7 @@ from ..utils import bytes_to_hex
 
 if TYPE_CHECKING:
     from .reward_calc.msg_data import TxData, DelegationInfo, DelegationTx, Header, BlockProduceInfoData, PRepsData
+    from .reward_calc.msg_data import Data
     from .reward_calc.msg_data import GovernanceVariable
     from ..iiss.storage import RewardRate
     from ..icx import IcxStorage
@@ -699,12 +700,14 @@ class Engine(EngineBase):
         :return: rc_state_hash
         """
         version: int = get_rc_version(rc_db_revision)
+        # Data to put to rc_block_batch at once in this order
+        rc_data_list: List['Data'] = []
 
         rc_state_hash: Optional[bytes] = None
         if self._is_iiss_calc(context.revision_changed_flag):
             self._update_state_db_on_end_calc(context)
             if bool(context.revision_changed_flag & RevisionChangedFlag.GENESIS_IISS_CALC):
-                self._put_header_to_rc_db(context, context.revision, 0, is_genesis_iiss=True)
+                rc_data_list.append(self._create_header_for_rc(context, context.revision, 0, is_genesis_iiss=True))
 
             # get rc_state_hash in calc done response.
             _, _, rc_state_hash = context.storage.rc.get_calc_response_from_rc()
@@ -712,27 +715,26 @@ class Engine(EngineBase):
         start: int = self.get_start_block_of_calc(context)
         # New calculation period is started
         if start == context.block.height:
-            self._put_header_to_rc_db(context, rc_db_revision, version)
-            self._put_gv_to_rc_db(context, version)
-
-        if not context.is_decentralized():
-            return rc_state_hash
-
-        if not context.is_the_first_block_on_decentralization():
-            self.put_block_produce_info_to_rc_db(context,
-                                                 context.rc_block_batch,
-                                                 prev_block_generator,
-                                                 prev_block_votes)
-
-        start_term_block: int = context.engine.prep.term.start_block_height
-        # New P-Rep Term is started
-        if start_term_block == context.block.height:
-            self._put_preps_to_rc_db(context, context.revision)
-            self._put_gv_to_rc_db(context, version)
-
-        if term is not None and term.is_in_term(context.block.height):
-            self._put_preps_to_rc_db(context, context.revision, term)
+            rc_data_list.append(self._create_header_for_rc(context, rc_db_revision, version))
+            rc_data_list.append(self._create_gv_for_rc(context, version))
 
+        if context.is_decentralized():
+            if not context.is_the_first_block_on_decentralization():
+                data: Optional['BlockProduceInfoData'] = \
+                    self._create_block_produce_info_for_rc(context, prev_block_generator, prev_block_votes)
+                if data is not None:
+                    rc_data_list.append(data)
+
+            start_term_block: int = context.engine.prep.term.start_block_height
+            # New P-Rep Term is started
+            if start_term_block == context.block.height:
+                rc_data_list.append(self._create_preps_for_rc(context, context.revision))
+                rc_data_list.append(self._create_gv_for_rc(context, version))
+
+            if term is not None and term.is_in_term(context.block.height):
+                rc_data_list.append(self._create_preps_for_rc(context, context.revision, term))
+
+        context.storage.rc.put_many(context.rc_block_batch, rc_data_list)
         return rc_state_hash
 
     def _update_state_db_on_end_calc(self, context: 'IconScoreContext'):
@@ -787,20 +789,17 @@ class Engine(EngineBase):
         context.storage.iiss.put_end_block_height_of_calc(context, context.block.height + calc_period)
 
     @classmethod
-    def _put_header_to_rc_db(cls,
-                             context: 'IconScoreContext',
-                             rc_db_revision: int,
-                             version: int,
-                             is_genesis_iiss: bool = False):
+    def _create_header_for_rc(cls,
+                              context: 'IconScoreContext',
+                              rc_db_revision: int,
+                              version: int,
+                              is_genesis_iiss: bool = False) -> 'Header':
 
         if is_genesis_iiss:
             block_height: int = context.block.height
         else:
             block_height: int = context.storage.iiss.get_end_block_height_of_calc(context)
-        data: 'Header' = RewardCalcDataCreator.create_header(version,
-                                                             block_height,
-                                                             rc_db_revision)
-        context.storage.rc.put(context.rc_block_batch, data)
+        return RewardCalcDataCreator.create_header(version, block_height, rc_db_revision)
 
     @staticmethod
     def _put_rrep(context: 'IconScoreContext'):
@@ -814,9 +813,9 @@ class Engine(EngineBase):
         context.storage.iiss.put_reward_rate(context, reward_rate)
 
     @classmethod
-    def _put_gv_to_rc_db(cls,
-                         context: 'IconScoreContext',
-                         version: int):
+    def _create_gv_for_rc(cls,
+                          context: 'IconScoreContext',
+                          version: int) -> 'GovernanceVariable':
 
         calculated_irep: int = 0
         if context.is_decentralized():
@@ -827,41 +826,40 @@ class Engine(EngineBase):
 
         # block height which GV variable has been calculated
         block_height: int = context.block.height - 1
-        data: 'GovernanceVariable' = RewardCalcDataCreator.create_gv_variable(version,
-                                                                              block_height,
-                                                                              calculated_irep,
-                                                                              reward_prep_for_rc,
-                                                                              context.main_prep_count,
-                                                                              context.main_and_sub_prep_count)
-        context.storage.rc.put(context.rc_block_batch, data)
+        return RewardCalcDataCreator.create_gv_variable(version,
+                                                        block_height,
+                                                        calculated_irep,
+                                                        reward_prep_for_rc,
+                                                        context.main_prep_count,
+                                                        context.main_and_sub_prep_count)
 
     @classmethod
-    def put_block_produce_info_to_rc_db(cls,
-                                        context: 'IconScoreContext',
-                                        rc_block_batch: list,
-                                        prev_block_generator: Optional['Address'] = None,
-                                        prev_block_votes: Optional[List[Tuple['Address', int]]] = None):
+    def _create_block_produce_info_for_rc(
+            cls,
+            context: 'IconScoreContext',
+            prev_block_generator: Optional['Address'] = None,
+            prev_block_votes: Optional[List[Tuple['Address', int]]] = None) -> Optional['BlockProduceInfoData']:
         """Called on every block
 
         :param context:
-        :param rc_block_batch:
         :param prev_block_generator:
         :param prev_block_votes:
-        :return:
+        :return: None if there is no information about the previous block
         """
         assert context.is_decentralized() and not context.is_the_first_block_on_decentralization()
         if prev_block_generator is None or prev_block_votes is None:
-            return
+            return None
 
-        # Logger.debug(f"put_block_produce_info_for_rc", "IISS")
         prev_block_height: int = context.block.height - 1
-        data: 'BlockProduceInfoData' = RewardCalcDataCreator.create_block_produce_info_data(prev_block_height,
-                                                                                            prev_block_generator,
-                                                                                            prev_block_votes)
-        context.storage.rc.put(rc_block_batch, data)
+        return RewardCalcDataCreator.create_block_produce_info_data(prev_block_height,
+                                                                    prev_block_generator,
+                                                                    prev_block_votes)
 
     @classmethod
-    def _put_preps_to_rc_db(cls, context: 'IconScoreContext', revision: int, term: Optional['Term'] = None):
+    def _create_preps_for_rc(cls,
+                             context: 'IconScoreContext',
+                             revision: int,
+                             term: Optional['Term'] = None) -> 'PRepsData':
         # If term is not None, it is the term which has been changed in term
         assert context.is_decentralized()
 
@@ -878,15 +876,14 @@ class Engine(EngineBase):
 
         Logger.info(
             tag=cls.TAG,
-            msg=f"_put_preps_for_rc_db() "
+            msg=f"_create_preps_for_rc() "
                 f"block_height={block_height} "
                 f"total_elected_prep_delegated={term.total_elected_prep_delegated} "
                 f"total_elected_prep_delegated_snapshot={term.total_elected_prep_delegated_snapshot}")
 
-        data: 'PRepsData' = RewardCalcDataCreator.create_prep_data(block_height,
-                                                                   total_elected_prep_delegated,
-                                                                   term.preps)
-        context.storage.rc.put(context.rc_block_batch, data)
+        return RewardCalcDataCreator.create_prep_data(block_height,
+                                                      total_elected_prep_delegated,
+                                                      term.preps)
 
     @classmethod
     def get_start_block_of_calc(cls, context: 'IconScoreContext') -> int:
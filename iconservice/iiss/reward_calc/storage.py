@@ -205,6 +205,14 @@ class Storage(object):
         Logger.debug(tag=IISS_LOG_TAG, msg=f"put data: {str(iiss_data)}")
         batch.append(iiss_data)
 
+    @staticmethod
+    def put_many(batch: list, iiss_data_list: List['Data']):
+        if not iiss_data_list:
+            return
+
+        Logger.debug(tag=IISS_LOG_TAG, msg=f"put data: {', '.join(str(data) for data in iiss_data_list)}")
+        batch.extend(iiss_data_list)
+
     def commit(self, iiss_wal: 'IissWAL'):
         self._db.write_batch(iiss_wal)
         self._db_iiss_tx_index = iiss_wal.final_tx_index
@@ -36,6 +36,8 @@ class PRepDictType(Enum):
 
 class PRep(Sortable):
     PREFIX: bytes = b"prep"
+    # Pre-encoded key heads indexed by AddressPrefix (EOA: 0, CONTRACT: 1)
+    _KEY_PREFIXES: Tuple[bytes, bytes] = (PREFIX + b"\x00", PREFIX + b"\x01")
     _VERSION: int = 2
     _UNKNOWN_COUNTRY = iso3166.Country(u"Unknown", "ZZ", "ZZZ", "000", u"Unknown")
 
@@ -411,7 +413,7 @@ class PRep(Sortable):
 
     @classmethod
     def make_key(cls, address: 'Address') -> bytes:
-        return cls.PREFIX + address.to_bytes_including_prefix()
+        return cls._KEY_PREFIXES[address.prefix] + address.body
 
     def is_frozen(self) -> bool:
         return self._is_frozen
@@ -84,9 +84,10 @@ class Storage(StorageBase):
         self._db.delete(context, key)
 
     def get_prep_iterator(self) -> Iterable['PRep']:
-        with self._db.key_value_db.get_sub_db(PRep.PREFIX).iterator() as it:
+        # P-Rep keys are made of AddressPrefix.EOA(0x00) and 20-byte address body
+        with self._db.key_value_db.get_sub_db(PRep.PREFIX).iterator(prefix=b'\x00') as it:
             for key, value in it:
-                if key[0] == 0x00 and len(key) == 21:
+                if len(key) == 21:
                     yield PRep.from_bytes(value)
 
     def put_term(self, context: 'IconScoreContext', term: 'Term'):
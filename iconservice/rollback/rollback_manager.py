@@ -69,19 +69,19 @@ class RollbackManager(object):
         for block_height in range(last_block_height - 1, rollback_block_height - 1, -1):
             # Make backup file with a given block_height
             path: str = self._get_backup_file_path(block_height)
-            if not os.path.isfile(path):
-                raise InternalServiceErrorException(f"Backup file not found: {path}")
-
-            reader.open(path)
+            try:
+                reader.open(path)
 
-            # Merge backup data into state_db_batch
-            self._write_batch(reader.get_iterator(WALDBType.STATE.value), state_db_batch)
+                # Merge backup data into state_db_batch
+                self._write_batch(reader.get_iterator(WALDBType.STATE.value), state_db_batch)
 
-            # Merge backup data into iiss_db_batch
-            if not (term_change_exists and block_height > calc_end_block_height):
-                self._write_batch(reader.get_iterator(WALDBType.RC.value), iiss_db_batch)
-
-            reader.close()
+                # Merge backup data into iiss_db_batch
+                if not (term_change_exists and block_height > calc_end_block_height):
+                    self._write_batch(reader.get_iterator(WALDBType.RC.value), iiss_db_batch)
+            except FileNotFoundError:
+                raise InternalServiceErrorException(f"Backup file not found: {path}")
+            finally:
+                reader.close()
 
         # If a term change is detected during rollback, handle the exceptions below
         if term_change_exists:
@@ -148,9 +148,6 @@ class RollbackManager(object):
         """Rename iiss_db to current_db
 
         """
-        Logger.debug(tag=TAG,
-                     msg=f"_rename_iiss_db_to_current_db() start: calc_end_block_height={calc_end_block_height}")
-
         filename = RewardCalcStorage.get_iiss_rc_db_name(calc_end_block_height)
         src_path = os.path.join(self._rc_data_path, filename)
         dst_path = os.path.join(self._rc_data_path, RewardCalcStorage.CURRENT_IISS_DB_NAME)
@@ -163,8 +160,6 @@ class RollbackManager(object):
             # Rename iiss_rc_db_{BH} to current_db
             os.rename(src_path, dst_path)
 
-        Logger.debug(tag=TAG, msg="_rename_iiss_db_to_current_db() end")
-
     @classmethod
     def _remove_block_produce_info(cls, iiss_db_batch: dict, block_height: int):
         """Remove block_produce_info of calc_period_end_block from current_db
@@ -173,11 +168,6 @@ class RollbackManager(object):
         :param block_height: the end block of the previous term
         :return:
         """
-        Logger.debug(tag=TAG,
-                     msg=f"_remove_block_produce_info() start: block_height={block_height}")
-
         # Remove the end calc block from iiss_db
         key: bytes = make_block_produce_info_key(block_height)
         iiss_db_batch[key] = None
-
-        Logger.debug(tag=TAG, msg="_remove_block_produce_info() end")
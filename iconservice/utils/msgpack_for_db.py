@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 from abc import ABCMeta, abstractmethod
 from enum import IntEnum
 from typing import Any
 
-from msgpack import dumps as msgpack_dumps, loads as msgpack_loads, ExtType as msgpack_extType
+from msgpack import Packer as msgpack_packer, loads as msgpack_loads, ExtType as msgpack_extType
 
 from . import int_to_bytes, bytes_to_int
 from ..base.address import Address
@@ -65,6 +66,9 @@ class MsgPackForDB(object):
     # you should assign CustomCodec if you want to parse custom type
     _codec: 'Codec' = BaseCodec()
 
+    # Packer is not thread-safe, so each thread reuses its own one
+    _thread_local = threading.local()
+
     class BaseType(IntEnum):
         NONE = 0
         BIG_INT = 1
@@ -88,9 +92,18 @@ class MsgPackForDB(object):
         else:
             return cls._codec.decode(t, b)
 
+    @classmethod
+    def _get_packer(cls) -> 'msgpack_packer':
+        packer = getattr(cls._thread_local, 'packer', None)
+        if packer is None:
+            packer = msgpack_packer(default=cls._encode, use_bin_type=True, strict_types=True)
+            cls._thread_local.packer = packer
+        return packer
+
     @classmethod
     def dumps(cls, data: Any) -> bytes:
-        return msgpack_dumps(data, default=cls._encode, use_bin_type=True, strict_types=True)
+        # Packer resets its internal buffer after each pack() by autoreset
+        return cls._get_packer().pack(data)
 
     @classmethod
     def loads(cls, data: bytes) -> list:
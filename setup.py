@@ -10,6 +10,7 @@ extra_requires = {
         "hypothesis>=4.0.0",
         "pytest>=3.6",
         "pytest-cov>=2.5.1",
+        "pytest-xdist",
         "iconsdk",
         "pytest-mock"
     ]
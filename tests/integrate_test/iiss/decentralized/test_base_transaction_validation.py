@@ -16,7 +16,6 @@
 
 """IconScoreEngine testcase
 """
-from copy import deepcopy
 from typing import TYPE_CHECKING, List
 
 from iconservice.base.address import SYSTEM_SCORE_ADDRESS
@@ -49,11 +48,11 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
 
     def _make_delegated_to_zero(self):
         # delegate to PRep
-        tx_list: list = []
-        for i in range(PREP_MAIN_PREPS):
-            tx: dict = self.create_set_delegation_tx(from_=self._accounts[PREP_MAIN_PREPS + i],
-                                                     origin_delegations=[])
-            tx_list.append(tx)
+        delegators: list = self._accounts[PREP_MAIN_PREPS:PREP_MAIN_AND_SUB_PREPS]
+        tx_list: list = [
+            self.create_set_delegation_tx(from_=delegator, origin_delegations=[])
+            for delegator in delegators
+        ]
         self.process_confirm_block_tx(tx_list)
 
     def _init_decentralized(self):
@@ -69,41 +68,44 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
         minimum_delegate_amount_for_decentralization: int = total_supply * 2 // 1000 + 1
         init_balance: int = minimum_delegate_amount_for_decentralization * 2
 
-        # distribute icx PREP_MAIN_PREPS ~ PREP_MAIN_PREPS + PREP_MAIN_PREPS - 1
-        self.distribute_icx(accounts=self._accounts[PREP_MAIN_PREPS:PREP_MAIN_AND_SUB_PREPS],
-                            init_balance=init_balance)
+        main_preps: list = self._accounts[:PREP_MAIN_PREPS]
+        delegators: list = self._accounts[PREP_MAIN_PREPS:PREP_MAIN_AND_SUB_PREPS]
 
-        # stake PREP_MAIN_PREPS ~ PREP_MAIN_PREPS + PREP_MAIN_PREPS - 1
-        stake_amount: int = minimum_delegate_amount_for_decentralization
-        tx_list: list = []
-        for i in range(PREP_MAIN_PREPS):
-            tx: dict = self.create_set_stake_tx(from_=self._accounts[PREP_MAIN_PREPS + i],
-                                                value=stake_amount)
-            tx_list.append(tx)
+        # distribute icx to PREP_MAIN_PREPS ~ PREP_MAIN_PREPS + PREP_MAIN_PREPS - 1 for stake
+        # and to 0 ~ PREP_MAIN_PREPS - 1 for register in a block
+        tx_list: list = [
+            self.create_transfer_icx_tx(from_=self._admin, to_=account, value=init_balance)
+            for account in delegators
+        ]
+        tx_list.extend(
+            self.create_transfer_icx_tx(from_=self._admin, to_=account, value=3000 * ICX_IN_LOOP)
+            for account in main_preps
+        )
         self.process_confirm_block_tx(tx_list)
 
-        # distribute icx for register PREP_MAIN_PREPS ~ PREP_MAIN_PREPS + PREP_MAIN_PREPS - 1
-        self.distribute_icx(accounts=self._accounts[:PREP_MAIN_PREPS],
-                            init_balance=3000 * ICX_IN_LOOP)
-
-        # register PRep
-        tx_list: list = []
-        for account in self._accounts[:PREP_MAIN_PREPS]:
-            tx: dict = self.create_register_prep_tx(from_=account)
-            tx_list.append(tx)
+        # stake PREP_MAIN_PREPS ~ PREP_MAIN_PREPS + PREP_MAIN_PREPS - 1
+        stake_amount: int = minimum_delegate_amount_for_decentralization
+        tx_list: list = [
+            self.create_set_stake_tx(from_=delegator, value=stake_amount)
+            for delegator in delegators
+        ]
         self.process_confirm_block_tx(tx_list)
 
-        # delegate to PRep
-        tx_list: list = []
-        for i in range(PREP_MAIN_PREPS):
-            tx: dict = self.create_set_delegation_tx(from_=self._accounts[PREP_MAIN_PREPS + i],
-                                                     origin_delegations=[
-                                                         (
-                                                             self._accounts[i],
-                                                             minimum_delegate_amount_for_decentralization
-                                                         )
-                                                     ])
-            tx_list.append(tx)
+        # register PRep and delegate to it in a block
+        tx_list: list = [
+            self.create_register_prep_tx(from_=account)
+            for account in main_preps
+        ]
+        tx_list.extend(
+            self.create_set_delegation_tx(from_=delegator,
+                                          origin_delegations=[
+                                              (
+                                                  main_prep,
+                                                  minimum_delegate_amount_for_decentralization
+                                              )
+                                          ])
+            for delegator, main_prep in zip(delegators, main_preps)
+        )
         self.process_confirm_block_tx(tx_list)
 
         # get main prep
@@ -140,6 +142,11 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
 
         return tx
 
+    @staticmethod
+    def _copy_issue_data(issue_data: dict) -> dict:
+        # The values of each group are immutable, so copying two levels is enough
+        return {group: dict(data) for group, data in issue_data.items()}
+
     def _create_dummy_tx(self):
         return self.create_transfer_icx_tx(self._admin, self._genesis, 0)
 
@@ -153,10 +160,8 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
         block = Block(block_height, block_hash, timestamp_us, self._prev_block_hash, 0)
         context.block = block
         issue_data = IconScoreContext.engine.issue.create_icx_issue_info(context)
-        total_issue_amount = 0
-        for group_dict in issue_data.values():
-            if "value" in group_dict:
-                total_issue_amount += group_dict["value"]
+        total_issue_amount: int = sum(
+            group_dict["value"] for group_dict in issue_data.values() if "value" in group_dict)
 
         return issue_data, total_issue_amount
 
@@ -211,60 +216,53 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
         # isBlockEditable is false in this method
 
         issue_data, total_issue_amount = self._make_issue_info()
+        # Invalid blocks are never committed, so the same dummy transactions can be reused
+        dummy_tx_list = [
+            self._create_dummy_tx(),
+            self._create_dummy_tx()
+        ]
 
         # failure case: when group(i.e. prep, eep, dapp) key in the issue transaction's data is different with
         # stateDB, should raise error
 
         # less than
-        copied_issue_data = deepcopy(issue_data)
+        copied_issue_data = self._copy_issue_data(issue_data)
         for group_key in issue_data.keys():
             temp = copied_issue_data[group_key]
             del copied_issue_data[group_key]
-            tx_list = [
-                self._make_base_tx(copied_issue_data),
-                self._create_dummy_tx(),
-                self._create_dummy_tx()
-            ]
-            self.assertRaises(InvalidBaseTransactionException, self._make_and_req_block_for_issue_test, tx_list)
+            tx_list = [self._make_base_tx(copied_issue_data), *dummy_tx_list]
+            with self.subTest(missing_group=group_key):
+                self.assertRaises(InvalidBaseTransactionException, self._make_and_req_block_for_issue_test, tx_list)
             copied_issue_data[group_key] = temp
 
         # more than
-        copied_issue_data = deepcopy(issue_data)
+        copied_issue_data = dict(issue_data)
         copied_issue_data['dummy_key'] = {}
-        tx_list = [
-            self._make_base_tx(copied_issue_data),
-            self._create_dummy_tx(),
-            self._create_dummy_tx()
-        ]
+        tx_list = [self._make_base_tx(copied_issue_data), *dummy_tx_list]
         self.assertRaises(InvalidBaseTransactionException, self._make_and_req_block_for_issue_test, tx_list)
 
         # failure case: when group's inner data key (i.e. incentiveRep, rewardRep, etc) is different
         # with stateDB (except value), should raise error
 
         # more than
-        copied_issue_data = deepcopy(issue_data)
-        for _, data in copied_issue_data.items():
+        copied_issue_data = self._copy_issue_data(issue_data)
+        for group, data in copied_issue_data.items():
             data['dummy_key'] = ""
-            tx_list = [
-                self._make_base_tx(copied_issue_data),
-                self._create_dummy_tx(),
-                self._create_dummy_tx()
-            ]
-            self.assertRaises(InvalidBaseTransactionException, self._make_and_req_block_for_issue_test, tx_list)
+            tx_list = [self._make_base_tx(copied_issue_data), *dummy_tx_list]
+            with self.subTest(group=group, extra_key='dummy_key'):
+                self.assertRaises(InvalidBaseTransactionException, self._make_and_req_block_for_issue_test, tx_list)
             del data['dummy_key']
 
         # less than
-        copied_issue_data = deepcopy(issue_data)
+        copied_issue_data = self._copy_issue_data(issue_data)
         for group, data in copied_issue_data.items():
             for key in issue_data[group].keys():
                 temp = data[key]
                 del data[key]
-                tx_list = [
-                    self._make_base_tx(copied_issue_data),
-                    self._create_dummy_tx(),
-                    self._create_dummy_tx()
-                ]
-                self.assertRaises(InvalidBaseTransactionException, self._make_and_req_block_for_issue_test, tx_list)
+                tx_list = [self._make_base_tx(copied_issue_data), *dummy_tx_list]
+                with self.subTest(group=group, missing_key=key):
+                    self.assertRaises(InvalidBaseTransactionException, self._make_and_req_block_for_issue_test,
+                                      tx_list)
                 data[key] = temp
 
     def test_validate_base_transaction_value_editable_block(self):
@@ -400,7 +398,6 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
                                                  end_block_height_of_calc - calc_period,
                                                  calculate_response_iscore_of_last_calc_period,
                                                  b'mocked_response')
-            print(f"calculate request block height: {end_block_height_of_calc - calc_period}")
             _self._calculate_done_callback(response)
 
         self._mock_ipc(mock_calculated)
@@ -418,10 +415,6 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
         expected_diff_in_calc_period = (expected_issue_amount * self.CALC_PERIOD) - \
                                        (response_iscore // ISCORE_EXCHANGE_RATE)
 
-        tx_list = [
-            self._create_dummy_tx()
-        ]
-
         for term in range(0, 3):
             def mock_calculated(_self, _path, _block_height):
                 context: 'IconScoreContext' = IconScoreContext(IconScoreContextType.QUERY)
@@ -429,7 +422,6 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
                 calc_period: int = context.storage.iiss.get_calc_period(context)
                 response = CalculateDoneNotification(0, True, end_block_height_of_calc - calc_period, response_iscore,
                                                      b'mocked_response')
-                print(f"calculate request block height: {end_block_height_of_calc - calc_period}")
                 _self._calculate_done_callback(response)
 
             self._mock_ipc(mock_calculated)
@@ -437,12 +429,11 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
             expected_sequence = term
             expected_start_block = next_calc
             expected_end_block = next_calc + self.CALC_PERIOD - 1
-            print(f"######################################## "
-                  f"term {term} "
-                  f"########################################")
             for bh_in_term in range(next_calc, next_calc + self.CALC_PERIOD):
-                copied_tx_list = deepcopy(tx_list)
-                prev_block, hash_list = self.make_and_req_block(copied_tx_list)
+                tx_list = [
+                    self._create_dummy_tx()
+                ]
+                prev_block, hash_list = self.make_and_req_block(tx_list)
                 self._write_precommit_state(prev_block)
                 tx_results: List['TransactionResult'] = self.get_tx_results(hash_list)
 
@@ -450,9 +441,6 @@ class TestIISSBaseTransactionValidation(TestIISSBase):
                 actual_covered_by_fee = tx_results[0].event_logs[1].data[0]
                 actual_covered_by_remain = tx_results[0].event_logs[1].data[1]
                 actual_issue_amount = tx_results[0].event_logs[1].data[2]
-                print(f"=================={bh_in_term}====================")
-                print(tx_results[0].event_logs[0].data)
-                print(tx_results[0].event_logs[1].data)
                 if bh_in_term == next_calc:
                     actual_sequence = tx_results[0].event_logs[2].data[0]
                     actual_start_block = tx_results[0].event_logs[2].data[1]
@@ -16,12 +16,15 @@
 
 """IconScoreEngine testcase
 """
-from typing import TYPE_CHECKING, List
+import os
+import shutil
+from typing import TYPE_CHECKING, List, Optional
 
 from iconservice.base.type_converter_templates import ConstantKeys
 from iconservice.icon_constant import ICX_IN_LOOP, PREP_MAIN_PREPS, IISS_INITIAL_IREP, ConfigKey, \
     PREP_MAIN_AND_SUB_PREPS
 from iconservice.icon_constant import PRepStatus, PRepGrade
+from tests import rmtree
 from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
 
 if TYPE_CHECKING:
@@ -34,9 +37,60 @@ class TestPreps(TestIISSBase):
         config[ConfigKey.PREP_REGISTRATION_FEE] = 0
         return config
 
+    # The decentralization bootstrap is the same for every test,
+    # so it runs once and each test starts from a copy of the resulting dbs
+    _snapshot: Optional[tuple] = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._snapshot_root_path = f"{cls._state_db_root_path}_snapshot"
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls._snapshot_root_path)
+        cls._snapshot = None
+        super().tearDownClass()
+
     def setUp(self):
-        super().setUp()
-        self.init_decentralized()
+        if self._snapshot is None:
+            super().setUp()
+            self.init_decentralized()
+            self._take_snapshot()
+        else:
+            self._restore_snapshot()
+
+    def _db_root_paths(self) -> tuple:
+        return self._score_root_path, self._state_db_root_path, self._iiss_db_root_path
+
+    def _take_snapshot(self):
+        self.icon_service_engine.close()
+
+        rmtree(self._snapshot_root_path)
+        for path in self._db_root_paths():
+            if os.path.isdir(path):
+                shutil.copytree(path, os.path.join(self._snapshot_root_path, path))
+        type(self)._snapshot = (self._config, self._block_height, self._prev_block_hash)
+
+        self._open_icon_service_engine()
+
+    def _restore_snapshot(self):
+        for path in self._db_root_paths():
+            rmtree(path)
+            if os.path.isdir(os.path.join(self._snapshot_root_path, path)):
+                shutil.copytree(os.path.join(self._snapshot_root_path, path), path)
+        self._config, self._block_height, self._prev_block_hash = self._snapshot
+
+        self._mock_wal_fsync()
+        self._open_icon_service_engine()
+
+    def _set_governance_variables_expecting_failure(self, irep: int):
+        tx: dict = self.create_set_governance_variables(self._accounts[0], irep)
+        prev_block, hash_list = self.make_and_req_block([tx])
+        self._write_precommit_state(prev_block)
+        tx_results: List['TransactionResult'] = self.get_tx_results(hash_list)
+        self.assertEqual(int(True), tx_results[0].status)
+        self.assertEqual(int(False), tx_results[1].status)
 
     def test_prep_rotate(self):
         """
@@ -98,14 +152,15 @@ class TestPreps(TestIISSBase):
         self.make_blocks_to_end_calculation()
 
         # get main prep list
-        expected_preps: list = []
-        for i in range(1, PREP_MAIN_PREPS):
-            expected_preps.append({
-                "address": self._accounts[i].address,
+        expected_preps: list = [{"address": self._accounts[PREP_MAIN_PREPS].address,
+                                 "delegated": delegation_amount}]
+        expected_preps.extend(
+            {
+                "address": account.address,
                 "delegated": 0
-            })
-        expected_preps.insert(0, {"address": self._accounts[PREP_MAIN_PREPS].address,
-                                  "delegated": delegation_amount})
+            }
+            for account in self._accounts[1:PREP_MAIN_PREPS]
+        )
 
         response: dict = self.get_main_prep_list()
         expected_response: dict = \
@@ -123,8 +178,8 @@ class TestPreps(TestIISSBase):
 
         # make blocks with prev_block_generator and prev_block_validators
         block_count: int = 20
-        self.make_blocks(
-            to=self._block_height + block_count,
+        self.make_empty_blocks(
+            count=block_count,
             prev_block_generator=self._accounts[0].address,
             prev_block_validators=[self._accounts[1].address,
                                    self._accounts[2].address]
@@ -182,33 +237,15 @@ class TestPreps(TestIISSBase):
         self.assertEqual(expected_update_block_height, response['irepUpdateBlockHeight'])
 
         # term validate
-        irep: int = origin_irep
-        tx: dict = self.create_set_governance_variables(self._accounts[0], irep)
-        prev_block, hash_list = self.make_and_req_block([tx])
-        self._write_precommit_state(prev_block)
-        tx_results: List['TransactionResult'] = self.get_tx_results(hash_list)
-        self.assertEqual(int(True), tx_results[0].status)
-        self.assertEqual(int(False), tx_results[1].status)
+        self._set_governance_variables_expecting_failure(origin_irep)
 
         self.make_blocks_to_end_calculation()
 
         # 20% below
-        irep: int = origin_irep * 8 - 1 // 10
-        tx: dict = self.create_set_governance_variables(self._accounts[0], irep)
-        prev_block, hash_list = self.make_and_req_block([tx])
-        self._write_precommit_state(prev_block)
-        tx_results: List['TransactionResult'] = self.get_tx_results(hash_list)
-        self.assertEqual(int(True), tx_results[0].status)
-        self.assertEqual(int(False), tx_results[1].status)
+        self._set_governance_variables_expecting_failure(origin_irep * 8 // 10 - 1)
 
-        # 20 above
-        irep: int = origin_irep * 12 + 1 // 10
-        tx: dict = self.create_set_governance_variables(self._accounts[0], irep)
-        prev_block, tx_results = self.make_and_req_block([tx])
-        self._write_precommit_state(prev_block)
-        tx_results: List['TransactionResult'] = self.get_tx_results(hash_list)
-        self.assertEqual(int(True), tx_results[0].status)
-        self.assertEqual(int(False), tx_results[1].status)
+        # 20% above
+        self._set_governance_variables_expecting_failure(origin_irep * 12 // 10 + 1)
 
     def test_set_governance_variables3(self):
         self.distribute_icx(accounts=self._accounts[:1],
@@ -16,7 +16,7 @@
 
 """IconScoreEngine testcase
 """
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict
 
 from iconservice.base.address import SYSTEM_SCORE_ADDRESS
 from iconservice.base.exception import ExceptionCode
@@ -24,9 +24,22 @@ from iconservice.icon_constant import IISS_MAX_DELEGATIONS, Revision, ICX_IN_LOO
 from iconservice.iconscore.icon_score_result import TransactionResult
 from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
 
+if TYPE_CHECKING:
+    from tests.integrate_test.test_integrate_base import EOAAccount
+
 
 class TestIISSDelegate(TestIISSBase):
 
+    def _make_delegations(self, start_index: int, amount: int) -> list:
+        return [(account, amount) for account in self._accounts[start_index:start_index + IISS_MAX_DELEGATIONS]]
+
+    def _assert_delegation(self, account: 'EOAAccount', delegations: list, total_delegated: int):
+        response: dict = self.get_delegation(account)
+        expected_delegations: list = [{"address": delegated_account.address,
+                                       "value": value} for (delegated_account, value) in delegations]
+        self.assertEqual(expected_delegations, response["delegations"])
+        self.assertEqual(total_delegated, response["totalDelegated"])
+
     def test_delegations_with_duplicated_addresses(self):
         self.update_governance()
 
@@ -85,51 +98,24 @@ class TestIISSDelegate(TestIISSBase):
 
         # set delegation 1 icx addr0 ~ addr9
         delegation_amount: int = 1 * ICX_IN_LOOP
-        total_delegating: int = 0
-        delegations: list = []
-        start_index: int = 0
-        for i in range(IISS_MAX_DELEGATIONS):
-            delegation_info: tuple = \
-                (
-                    self._accounts[start_index + i],
-                    delegation_amount
-                )
-            delegations.append(delegation_info)
-            total_delegating += delegation_amount
+        delegations: list = self._make_delegations(start_index=0, amount=delegation_amount)
+        total_delegating: int = delegation_amount * len(delegations)
 
         self.set_delegation(from_=self._accounts[0],
                             origin_delegations=delegations)
 
         # get delegation
-        response: dict = self.get_delegation(self._accounts[0])
-        expected_response: list = [{"address": account.address,
-                                    "value": value} for (account, value) in delegations]
-        self.assertEqual(expected_response, response["delegations"])
-        self.assertEqual(total_delegating, response["totalDelegated"])
+        self._assert_delegation(self._accounts[0], delegations, total_delegating)
 
         # other delegation 1 icx addr10 ~ addr19
-        delegation_amount: int = 1 * ICX_IN_LOOP
-        total_delegating: int = 0
-        delegations: list = []
-        start_index: int = 10
-        for i in range(IISS_MAX_DELEGATIONS):
-            delegation_info: tuple = \
-                (
-                    self._accounts[start_index + i],
-                    delegation_amount
-                )
-            delegations.append(delegation_info)
-            total_delegating += delegation_amount
+        delegations: list = self._make_delegations(start_index=10, amount=delegation_amount)
+        total_delegating: int = delegation_amount * len(delegations)
 
         self.set_delegation(from_=self._accounts[0],
                             origin_delegations=delegations)
 
         # get delegation
-        response: dict = self.get_delegation(self._accounts[0])
-        expected_response: list = [{"address": account.address,
-                                    "value": value} for (account, value) in delegations]
-        self.assertEqual(expected_response, response["delegations"])
-        self.assertEqual(total_delegating, response["totalDelegated"])
+        self._assert_delegation(self._accounts[0], delegations, total_delegating)
 
     def test_delegation_invalid_params(self):
         self.update_governance()
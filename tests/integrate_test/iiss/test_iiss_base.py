@@ -471,42 +471,39 @@ class TestIISSBase(TestIntegrateBase):
         minimum_delegate_amount_for_decentralization: int = total_supply * 2 // 1000 + 1
         init_balance: int = minimum_delegate_amount_for_decentralization * 2
 
-        # distribute icx PREP_MAIN_PREPS ~ PREP_MAIN_PREPS + PREP_MAIN_PREPS - 1
-        self.distribute_icx(accounts=self._accounts[PREP_MAIN_PREPS:PREP_MAIN_AND_SUB_PREPS],
-                            init_balance=init_balance)
+        main_preps: list = self._accounts[:PREP_MAIN_PREPS]
+        stakers: list = self._accounts[PREP_MAIN_PREPS:PREP_MAIN_AND_SUB_PREPS]
+
+        # distribute icx PREP_MAIN_PREPS ~ PREP_MAIN_PREPS + PREP_MAIN_PREPS - 1 to stake and delegate
+        # and 3000 icx to the self._accounts which range from 0 to PREP_MAIN_PREPS, exclusive, to register
+        tx_list: list = [self.create_transfer_icx_tx(from_=self._admin,
+                                                     to_=account,
+                                                     value=init_balance)
+                         for account in stakers]
+        tx_list.extend(self.create_transfer_icx_tx(from_=self._admin,
+                                                   to_=account,
+                                                   value=icx_to_loop(3000))
+                       for account in main_preps)
+        self.process_confirm_block_tx(tx_list)
 
         # stake PREP_MAIN_PREPS ~ PREP_MAIN_PREPS + PREP_MAIN_PREPS - 1
         stake_amount: int = minimum_delegate_amount_for_decentralization
-        tx_list: list = []
-        for i in range(PREP_MAIN_PREPS):
-            tx: dict = self.create_set_stake_tx(from_=self._accounts[PREP_MAIN_PREPS + i],
-                                                value=stake_amount)
-            tx_list.append(tx)
-        self.process_confirm_block_tx(tx_list)
-
-        # distribute 3000 icx to the self._accounts
-        # which range from 0 to PREP_MAIN_PREPS, exclusive
-        self.distribute_icx(accounts=self._accounts[:PREP_MAIN_PREPS],
-                            init_balance=icx_to_loop(3000))
-
-        # register PRep
-        tx_list: list = []
-        for account in self._accounts[:PREP_MAIN_PREPS]:
-            tx: dict = self.create_register_prep_tx(from_=account)
-            tx_list.append(tx)
+        tx_list: list = [self.create_set_stake_tx(from_=account,
+                                                  value=stake_amount)
+                         for account in stakers]
         self.process_confirm_block_tx(tx_list)
 
-        # delegate to PRep
-        tx_list: list = []
-        for i in range(PREP_MAIN_PREPS):
-            tx: dict = self.create_set_delegation_tx(from_=self._accounts[PREP_MAIN_PREPS + i],
+        # register PRep and delegate to it in the same block
+        tx_list: list = [self.create_register_prep_tx(from_=account)
+                         for account in main_preps]
+        tx_list.extend(self.create_set_delegation_tx(from_=staker,
                                                      origin_delegations=[
                                                          (
-                                                             self._accounts[i],
+                                                             prep,
                                                              minimum_delegate_amount_for_decentralization
                                                          )
                                                      ])
-            tx_list.append(tx)
+                       for staker, prep in zip(stakers, main_preps))
         self.process_confirm_block_tx(tx_list)
 
         # get main prep
@@ -529,14 +526,14 @@ class TestIISSBase(TestIntegrateBase):
 
         # get main prep
         response: dict = self.get_main_prep_list()
-        expected_preps: list = []
-        expected_total_delegated: int = 0
-        for account in self._accounts[:PREP_MAIN_PREPS]:
-            expected_preps.append({
+        expected_preps: list = [
+            {
                 'address': account.address,
                 'delegated': minimum_delegate_amount_for_decentralization
-            })
-            expected_total_delegated += minimum_delegate_amount_for_decentralization
+            }
+            for account in main_preps
+        ]
+        expected_total_delegated: int = minimum_delegate_amount_for_decentralization * len(main_preps)
         expected_response: dict = {
             "preps": expected_preps,
             "totalDelegated": expected_total_delegated
@@ -544,23 +541,22 @@ class TestIISSBase(TestIntegrateBase):
         self.assertEqual(expected_response, response)
 
         # delegate to PRep 0
-        tx_list: list = []
-        for account in self._accounts:
-            tx: dict = self.create_set_delegation_tx(from_=account,
-                                                     origin_delegations=[])
-            tx_list.append(tx)
+        tx_list: list = [self.create_set_delegation_tx(from_=account,
+                                                       origin_delegations=[])
+                         for account in self._accounts]
         self.process_confirm_block_tx(tx_list)
 
         self.make_blocks_to_end_calculation()
 
         # get main prep
         response: dict = self.get_main_prep_list()
-        expected_preps: list = []
-        for account in self._accounts[:PREP_MAIN_PREPS]:
-            expected_preps.append({
+        expected_preps: list = [
+            {
                 'address': account.address,
                 'delegated': 0
-            })
+            }
+            for account in main_preps
+        ]
         expected_response: dict = {
             "preps": expected_preps,
             "totalDelegated": 0
@@ -570,10 +566,8 @@ class TestIISSBase(TestIntegrateBase):
         max_expired_block_height: int = self._config[ConfigKey.IISS_META_DATA][ConfigKey.UN_STAKE_LOCK_MAX]
         self.make_blocks(self._block_height + max_expired_block_height + 1)
 
-        tx_list: list = []
-        for account in self._accounts:
-            tx: dict = self.create_set_stake_tx(from_=account, value=0)
-            tx_list.append(tx)
+        tx_list: list = [self.create_set_stake_tx(from_=account, value=0)
+                         for account in self._accounts]
         self.process_confirm_block_tx(tx_list)
 
         tx_list: list = []
@@ -17,9 +17,10 @@
 """IconServiceEngine testcase
 """
 import copy
+import os
 from typing import TYPE_CHECKING, Union, Optional, Any, List, Tuple
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from iconcommons import IconConfig
 from iconsdk.wallet.wallet import KeyWallet
@@ -54,9 +55,11 @@ class TestIntegrateBase(TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls._score_root_path = '.score'
-        cls._state_db_root_path = '.statedb'
-        cls._iiss_db_root_path = '.iissdb'
+        # Every pytest-xdist worker has its own db directories
+        worker_id: str = os.environ.get("PYTEST_XDIST_WORKER", "")
+        cls._score_root_path = f'.score{worker_id}'
+        cls._state_db_root_path = f'.statedb{worker_id}'
+        cls._iiss_db_root_path = f'.iissdb{worker_id}'
 
         cls._test_sample_root = "samples"
         cls._signature = "VAia7YZ2Ji6igKWzjR2YsGa2m53nKPrfK7uXYW78QLE+ATehAVZPC40szvAiA6NEU5gCYB4c4qaQzqDh2ugcHgA="
@@ -90,12 +93,16 @@ class TestIntegrateBase(TestCase):
 
         self._config: 'IconConfig' = config
 
+        self._mock_wal_fsync()
+        self._open_icon_service_engine()
+
+        self._genesis_invoke()
+
+    def _open_icon_service_engine(self):
         self.icon_service_engine = IconServiceEngine()
 
         self._mock_ipc()
-        self.icon_service_engine.open(config)
-
-        self._genesis_invoke()
+        self.icon_service_engine.open(self._config)
 
     def get_block_height(self) -> int:
         return self._block_height
@@ -124,6 +131,12 @@ class TestIntegrateBase(TestCase):
         RewardCalcProxy.commit_claim = Mock()
         RewardCalcProxy.query_calculate_result = Mock(return_value=(RCCalculateResult.SUCCESS, 0, 0, bytes()))
 
+    def _mock_wal_fsync(self):
+        # A test doesn't need its write ahead log to survive a power failure
+        patcher = patch("iconservice.database.wal.os.fsync")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def tearDown(self):
         self.icon_service_engine.close()
         root_clear(self._score_root_path, self._state_db_root_path, self._iiss_db_root_path)
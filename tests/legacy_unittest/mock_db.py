@@ -56,8 +56,10 @@ class MockPlyvelDB(object):
     def get_sub_db(self, key: bytes):
         return MockPlyvelDB(self.make_db())
 
-    def iterator(self) -> iter:
-        return iter(self._db)
+    def iterator(self, prefix: Optional[bytes] = None) -> iter:
+        if prefix is None:
+            return iter(self._db)
+        return (key for key in self._db if key.startswith(prefix))
 
     def prefixed_db(self, bytes_prefix) -> 'MockPlyvelDB':
         return MockPlyvelDB(MockPlyvelDB.make_db())
@@ -370,3 +370,12 @@ def test_setter(prep):
         # If new value is different from the old one, flag should be set
         setattr(prep, key, new_value)
         assert prep.is_flags_on(flag)
+
+
+@pytest.mark.parametrize("prefix", [AddressPrefix.EOA, AddressPrefix.CONTRACT])
+def test_make_key(prefix):
+    address = Address(prefix, os.urandom(20))
+
+    key: bytes = PRep.make_key(address)
+
+    assert key == PRep.PREFIX + address.to_bytes_including_prefix()
@@ -18,8 +18,10 @@ import os
 import shutil
 import unittest
 from collections import OrderedDict
+from unittest.mock import patch
 
 from iconservice.base.block import Block
+from iconservice.base.exception import InternalServiceErrorException, IllegalFormatException
 from iconservice.database.db import KeyValueDatabase
 from iconservice.database.wal import WriteAheadLogReader, WALDBType
 from iconservice.icon_constant import Revision
@@ -147,6 +149,51 @@ class TestBackupManager(unittest.TestCase):
         self._check_if_rollback_is_done(self.rc_db, self.org_rc_db_data)
         self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
 
+    def test_run_without_backup_file(self):
+        with self.assertRaises(InternalServiceErrorException):
+            self.rollback_manager.run(
+                last_block_height=101,
+                rollback_block_height=100,
+                term_start_block_height=99)
+
+        self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
+
+    def test_run_with_corrupted_backup_file(self):
+        path: str = os.path.join(self.backup_root_path, get_backup_filename(100))
+        with open(path, "wb") as f:
+            f.write(b"corrupted")
+
+        with patch.object(WriteAheadLogReader, "close",
+                          autospec=True, side_effect=WriteAheadLogReader.close) as close:
+            with self.assertRaises(IllegalFormatException):
+                self.rollback_manager.run(
+                    last_block_height=101,
+                    rollback_block_height=100,
+                    term_start_block_height=99)
+
+            # The backup file is closed even if its header is invalid
+            close.assert_called_once()
+
+    def test_rename_iiss_db_to_current_db(self):
+        calc_end_block_height = 99
+        iiss_db_data = _create_dummy_data(2)
+
+        iiss_db_path = os.path.join(self.rc_data_path, RewardCalcStorage.get_iiss_rc_db_name(calc_end_block_height))
+        iiss_db = KeyValueDatabase.from_path(iiss_db_path, create_if_missing=True)
+        iiss_db.write_batch(iiss_db_data.items())
+        iiss_db.close()
+
+        self.rc_db.close()
+        self.rc_db = None
+
+        self.rollback_manager._rename_iiss_db_to_current_db(calc_end_block_height)
+
+        assert not os.path.exists(iiss_db_path)
+        assert sorted(os.listdir(self.rc_data_path)) == [RewardCalcStorage.CURRENT_IISS_DB_NAME]
+
+        self.rc_db = _create_rc_db(self.rc_data_path)
+        self._check_if_rollback_is_done(self.rc_db, iiss_db_data)
+
     @staticmethod
     def _commit_state_db(db: 'KeyValueDatabase', block_batch: OrderedDict):
         db.write_batch(block_batch.items())
@@ -158,6 +158,18 @@ class TestMsgpackForStateDB(unittest.TestCase):
         struct: list = MsgPackForDB.loads(data)
         self.assertEqual(expected_struct, struct)
 
+    def test_msgpack_for_db_dumps_after_error(self):
+        expected_struct: list = [0, create_address(), b'hello']
+
+        data: bytes = MsgPackForDB.dumps(expected_struct)
+
+        # A failed dumps() leaves nothing in the reused packer
+        with self.assertRaises(TypeError):
+            MsgPackForDB.dumps([1, 2, object()])
+
+        self.assertEqual(data, MsgPackForDB.dumps(expected_struct))
+        self.assertEqual(expected_struct, MsgPackForDB.loads(data))
+
     def test_msgpack_for_db_length(self):
         int_table = [-1, 0, 1, 10 ** 30]
         bytes_table = [b'hello', b'', SYSTEM_SCORE_ADDRESS.to_bytes()]
@@ -129,3 +129,27 @@ def test_func_param_address_none():
     annotations = TypeConverter.make_annotations_from_method(TEST_SCORE.func_param_address1)
     TypeConverter.convert_data_params(annotations, params)
     assert value == TEST_SCORE.func_param_address1(**params)
+
+
+def test_adjust_params_to_method_caches_annotations(mocker):
+    # A new class so that no other test has cached the annotations of its method
+    class Score:
+        def func_param_int(self, value: int) -> int:
+            return value
+
+    spy = mocker.spy(TypeConverter, "make_annotations_from_method")
+
+    for value in range(3):
+        params = {"value": hex(value)}
+        TypeConverter.adjust_params_to_method(Score().func_param_int, params)
+        assert value == params["value"]
+
+    assert spy.call_count == 1
+
+    # The bound and unbound forms of a method share one cache entry
+    params = {"value": hex(3)}
+    TypeConverter.adjust_params_to_method(Score.func_param_int, params)
+    assert 3 == params["value"]
+    assert spy.call_count == 1
+    assert TypeConverter._get_method_annotations(Score.func_param_int) is \
+        TypeConverter._get_method_annotations(Score().func_param_int)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+from iconservice.base.exception import IllegalFormatException
+from iconservice.iconscore.score_package_validator import ScorePackageValidator
+
+WHITELIST = {"iconservice": ["*"], "os": ["path"]}
+
+
+@pytest.fixture
+def score_package(tmp_path, monkeypatch):
+    package_name = f"score_pkg_{os.urandom(4).hex()}"
+    root = tmp_path / package_name
+    sub = root / "sub"
+    sub.mkdir(parents=True)
+
+    (root / "__init__.py").write_text("from .score import *\n")
+    (root / "score.py").write_text("from iconservice import *\nfrom os import path\n")
+    (root / "package.json").write_text("{}")
+    (sub / "__init__.py").write_text("")
+    (sub / "util.py").write_text("import os\n")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return root, package_name
+
+
+def test_make_custom_import_list(score_package):
+    root, _ = score_package
+
+    import_list = ScorePackageValidator._make_custom_import_list(str(root))
+
+    assert sorted(import_list) == ["__init__", "score", "sub.__init__", "sub.util"]
+
+
+def test_execute(score_package):
+    root, package_name = score_package
+
+    ScorePackageValidator.execute(dict(WHITELIST), str(root), package_name)
+
+    (root / "sub" / "util.py").write_text("import os\neval('1')\n")
+    with pytest.raises(IllegalFormatException):
+        ScorePackageValidator.execute(dict(WHITELIST), str(root), package_name)
+
+
+def test_execute_with_changed_whitelist(score_package):
+    root, package_name = score_package
+
+    ScorePackageValidator.execute(dict(WHITELIST), str(root), package_name)
+
+    with pytest.raises(IllegalFormatException):
+        ScorePackageValidator.execute({"iconservice": ["*"]}, str(root), package_name)
+
+
+def test_execute_validates_modules_not_imported(score_package):
+    root, package_name = score_package
+
+    # Every module in the package is validated even if no module imports it
+    (root / "sub" / "unused.py").write_text("import sys\n")
+    with pytest.raises(IllegalFormatException):
+        ScorePackageValidator.execute(dict(WHITELIST), str(root), package_name)
+
+
+def test_execute_reports_violations_in_code_order(score_package):
+    root, package_name = score_package
+
+    # Nested code objects are checked in the order they are defined
+    (root / "score.py").write_text("def a():\n    import sys\n\n\ndef b():\n    eval('1')\n")
+    with pytest.raises(IllegalFormatException, match="Invalid import name: sys"):
+        ScorePackageValidator.execute(dict(WHITELIST), str(root), package_name)
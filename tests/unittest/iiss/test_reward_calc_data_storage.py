@@ -210,6 +210,16 @@ class TestRcDataStorage:
         with pytest.raises(AssertionError):
             rc_data_storage.replace_db(block_height)
 
+    def test_put_many(self, dummy_header, dummy_gv, dummy_prep, rc_data_storage):
+        batch: list = [dummy_header]
+
+        rc_data_storage.put_many(batch, [])
+        assert batch == [dummy_header]
+
+        # TEST: data should be appended in the given order
+        rc_data_storage.put_many(batch, [dummy_gv, dummy_prep])
+        assert batch == [dummy_header, dummy_gv, dummy_prep]
+
     def test_commit_without_iiss_tx(self, dummy_header, dummy_gv, dummy_prep, rc_data_storage):
         # TEST: when there is no iiss_tx data, index should not be increased
         dummy_iiss_data_list_without_iiss_tx = [dummy_header, dummy_gv, dummy_prep]